@@ -1,14 +1,17 @@
 import networkx as nx
+import numpy as np
 import os
 import time
 import multiprocessing
-from itertools import combinations
-from graph_utils import parse_graph_from_text, write_result_to_file, visualize_and_save_edge_dominating_set
+from itertools import chain, combinations, islice
+from graph_utils import run_pipeline, write_results_to_file, visualize_and_save_edge_dominating_set
+from symmetry import edge_permutations, pruned_subset_blocks
 
 TIMEOUT = 240  # Timeout in seconds (2 minutes)
 GRAPH_TEXT_FILE = "Graphs/all_graphs_data.txt"
 RESULT_TEXT_FILE = "Graphs/min_edge_dominating_sets.txt"
 MIN_EDGE_DOMINATING_IMG_DIR = "Graphs/ExaustiveSearchImages"
+BLOCK_SIZE = 4096  # Candidate subsets tested together in one vectorized check
 
 # Ensure the directory exists
 os.makedirs(MIN_EDGE_DOMINATING_IMG_DIR, exist_ok=True)
@@ -17,24 +20,6 @@ def sorted_edge(u, v):
     """Return a tuple with the smaller node first."""
     return (u, v) if u <= v else (v, u)
 
-def get_sorted_adjacent_edges(G, node):
-    """Return a set of sorted edges adjacent to a node."""
-    return set(sorted_edge(node, neighbor) for neighbor in G.neighbors(node))
-
-
-def is_edge_dominating_set(G, edge_subset, all_edges):
-    """Check if the edge_subset is an edge dominating set of G."""
-    # Use sorted edges for consistent representation
-    edge_subset = set(sorted_edge(u, v) for u, v in edge_subset)
-    all_edges = set(sorted_edge(u, v) for u, v in all_edges)
-    
-    for edge in all_edges - edge_subset:
-        u, v = edge
-        # Check if edge is adjacent to any edge in edge_subset
-        if not any(u in e or v in e for e in edge_subset):
-            return False
-    return True
-
 def minimum_edge_dominating_set_with_timeout(G, timeout=TIMEOUT):
     result_queue = multiprocessing.Queue()
     process = multiprocessing.Process(target=minimum_edge_dominating_set_process, args=(G, result_queue))
@@ -52,43 +37,100 @@ def minimum_edge_dominating_set_with_timeout(G, timeout=TIMEOUT):
     duration = time.time() - start_time
     return min_set, operation_count, duration, False
 
-def minimum_edge_dominating_set_process(G, result_queue):
-    all_edges = set(sorted_edge(u, v) for u, v in G.edges())
-    min_dominating_set = None
+def closed_neighbourhood_matrix(edges):
+    """Return a bit-packed matrix whose row i marks every edge sharing a vertex with edges[i], itself included."""
+    nodes = {node: i for i, node in enumerate(sorted(set(node for edge in edges for node in edge)))}
+    incidence = np.zeros((len(nodes), len(edges)), dtype=bool)
+    for i, (u, v) in enumerate(edges):
+        incidence[nodes[u], i] = incidence[nodes[v], i] = True
+    # The row of an edge is the OR of the packed incidence rows of its two endpoints
+    packed = np.packbits(incidence, axis=1)
+    endpoints = np.array([(nodes[u], nodes[v]) for u, v in edges], dtype=np.intp)
+    return packed[endpoints[:, 0]] | packed[endpoints[:, 1]]
+
+def candidate_blocks(num_edges, size, block_size=BLOCK_SIZE):
+    """Yield the combinations of size edge indices, in order, as (block_size x size) index arrays."""
+    subsets = combinations(range(num_edges), size)
+    while True:
+        block = np.fromiter(chain.from_iterable(islice(subsets, block_size)), dtype=np.intp)
+        if not block.size:
+            return
+        yield block.reshape(-1, size)
+
+def check_deadline(deadline, operation_count):
+    if deadline is not None and time.time() > deadline:
+        raise TimeoutError(f"Exhaustive search stopped after {operation_count} configurations")
+
+def minimum_edge_dominating_set_batched(G, block_size=BLOCK_SIZE, deadline=None, symmetry=True):
+    """Find a minimum edge dominating set by testing whole blocks of candidate subsets at once.
+
+    Each candidate is dominating when the OR of its rows of the closed neighbourhood
+    matrix has every bit set. The operation count is the exact number of subsets
+    tested up to and including the first dominating one. If deadline (a time.time()
+    value) passes, TimeoutError is raised during setup or between blocks.
+
+    With symmetry, a subset is only generated and tested if no automorphism of G
+    that fixes its prefix maps its last edge to a smaller one, which finds the same
+    set. The operation count then also includes the subsets this rejects before
+    the first dominating one, so it counts every configuration considered.
+    """
+    all_edges = sorted(sorted_edge(u, v) for u, v in G.edges())
     operation_count = 0
+    if not all_edges:
+        return None, operation_count
+
+    check_deadline(deadline, operation_count)
+    matrix = closed_neighbourhood_matrix(all_edges)
+    full_row = np.packbits(np.ones(len(all_edges), dtype=bool))
+    check_deadline(deadline, operation_count)
+    permutations = edge_permutations(G, all_edges, deadline=deadline) if symmetry else []
 
     for size in range(1, len(all_edges) + 1):
-        found = False
-        for edge_subset in combinations(all_edges, size):
-            operation_count += 1
-            edge_subset_set = set(edge_subset)
-            
-            if is_edge_dominating_set(G, edge_subset_set, all_edges):
-                min_dominating_set = edge_subset_set
-                found = True
-                break  # Found a minimal set of current size
+        if permutations:
+            blocks = pruned_subset_blocks(len(all_edges), size, permutations, block_size)
+        else:
+            blocks = ((block, np.zeros(len(block) + 1, dtype=np.intp)) for block in candidate_blocks(len(all_edges), size, block_size))
+        # rejected[i] counts the subsets symmetry skipped before row i of the block, rejected[-1] all of them
+        for block, rejected in blocks:
+            covered = np.bitwise_or.reduce(matrix[block], axis=1)
+            dominating = np.flatnonzero((covered == full_row).all(axis=1))
+            if dominating.size:
+                operation_count += dominating[0] + 1 + rejected[dominating[0]]
+                return set(all_edges[i] for i in block[dominating[0]]), int(operation_count)
+            operation_count += len(block) + rejected[-1]
+            check_deadline(deadline, operation_count)
+
+    return None, operation_count
+
+def minimum_edge_dominating_set_process(G, result_queue):
+    result_queue.put(minimum_edge_dominating_set_batched(G))
+
+def write_exhaustive_results(batch):
+    """Save the results and images of a batch of solved graphs; a failed image does not lose any results."""
+    write_results_to_file(RESULT_TEXT_FILE, [
+        (graph_name, *result) for _, graph_name, _, _, result in batch
+    ])
 
-        if found:
-            break  # No need to check larger sizes
+    for G, graph_name, num_vertices, density, (min_edge_dominating_set, operation_count, duration, timed_out) in batch:
+        if not timed_out and min_edge_dominating_set:
+            try:
+                visualize_and_save_edge_dominating_set(
+                    G, min_edge_dominating_set, graph_name, MIN_EDGE_DOMINATING_IMG_DIR,
+                    title=f"Minimum Edge Dominating Set for {graph_name}", color="red"
+                )
+            except Exception as e:
+                print(f"Error while saving image for {graph_name}: {e}")
 
-    result_queue.put((min_dominating_set, operation_count))
+def solve_exhaustive(G, graph_name, num_vertices, density):
+    print(f"Processing {graph_name} with {num_vertices} vertices and density {density}")
+    return minimum_edge_dominating_set_with_timeout(G)
 
 def main():
     with open(RESULT_TEXT_FILE, "w") as f:
         f.write("")
 
-    for G, graph_name, num_vertices, density in parse_graph_from_text(GRAPH_TEXT_FILE):
-        print(f"Processing {graph_name} with {num_vertices} vertices and density {density}")
-        
-        min_edge_dominating_set, operation_count, duration, timed_out = minimum_edge_dominating_set_with_timeout(G)
-        
-        if not timed_out and min_edge_dominating_set:
-            visualize_and_save_edge_dominating_set(
-                G, min_edge_dominating_set, graph_name, MIN_EDGE_DOMINATING_IMG_DIR,
-                title=f"Minimum Edge Dominating Set for {graph_name}", color="red"
-            )
-        
-        write_result_to_file(RESULT_TEXT_FILE, graph_name, min_edge_dominating_set, operation_count, duration, timed_out)
+    # Parse ahead, solve and write results as they arrive
+    run_pipeline(GRAPH_TEXT_FILE, solve_exhaustive, write_exhaustive_results)
 
 if __name__ == "__main__":
     main()
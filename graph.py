@@ -6,6 +6,7 @@ import matplotlib.pyplot as plt  # For graph visualization
 import os
 from itertools import combinations
 import shutil
+from graph_utils import draw_edges_fast, draw_nodes_fast, is_large_graph
 
 # Seed for reproducibility (use your student number)
 random.seed(124467)
@@ -47,16 +48,22 @@ def create_graph_with_density(num_vertices, density, min_distance=10):
     G.add_edges_from(random.sample(possible_edges, num_edges))
     return G
 
-def save_graph_as_image(graph, filename):
-    """Save the graph visualization as a PNG image."""
+def save_graph_as_image(graph, filename, fast=None, max_edges=None, rasterized=False):
+    """Save the graph visualization as a PNG image, using the fast renderer for large graphs."""
     filepath = os.path.join(GRAPH_DIR_IMG, filename + ".png")
     pos = nx.get_node_attributes(graph, 'pos')  # Get node positions
     
     # Draw and save the graph as an image
-    plt.figure(figsize=(8, 6))
-    nx.draw(graph, pos, with_labels=True, node_color='skyblue', edge_color='gray', node_size=1500, font_size=15)
-    plt.savefig(filepath, format="png")
-    plt.close()  # Close the plot to free memory
+    fig = plt.figure(figsize=(8, 6))
+    if fast or (fast is None and is_large_graph(graph)):
+        ax = plt.gca()
+        draw_edges_fast(ax, pos, graph.edges(), color='gray', max_edges=max_edges, rasterized=rasterized)
+        draw_nodes_fast(ax, graph, pos, color='skyblue')
+        ax.set_axis_off()
+    else:
+        nx.draw(graph, pos, with_labels=True, node_color='skyblue', edge_color='gray', node_size=1500, font_size=15)
+    fig.savefig(filepath, format="png")  # Unlike plt.savefig, does not redraw the figure afterwards
+    plt.close(fig)  # Close the plot to free memory
     print(f"Graph image saved as: {filepath}")
 
 def append_graph_to_text_file(graph, filename, num_vertices, density):
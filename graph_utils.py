@@ -1,90 +1,213 @@
 import networkx as nx
 import os
-import matplotlib.pyplot as plt
+import queue
+import threading
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+# Marks the end of the stream between pipeline stages
+_PIPELINE_DONE = object()
+
+# Graphs with more edges than this are drawn with the fast renderer
+LARGE_GRAPH_EDGES = 1000
+# Node labels are skipped above this many vertices
+MAX_LABELLED_NODES = 200
+FAST_NODE_SIZE = 10
 
 def parse_graph_from_text(file):
     """Parse graphs from a text file."""
     with open(file, "r") as f:
-        G = None
-        graph_name = ""
-        num_vertices = 0
-        density = 0.0
-        reading_nodes = False
-        reading_edges = False
-
-        for line in f:
-            line = line.strip()
-            if line.startswith("Graph:"):
-                if G is not None:
-                    yield G, graph_name, num_vertices, density
-                
-                graph_name = line.split(":")[1].strip()
-                G = nx.Graph()
-                reading_nodes = reading_edges = False
+        yield from parse_graph_from_lines(f)
+
+def parse_graph_from_lines(lines):
+    """Parse graphs from lines in the text file format, e.g. a graph sent as a string."""
+    G = None
+    graph_name = ""
+    num_vertices = 0
+    density = 0.0
+    reading_nodes = False
+    reading_edges = False
+
+    for line in lines:
+        line = line.strip()
+        if line.startswith("Graph:"):
+            if G is not None:
+                yield G, graph_name, num_vertices, density
             
-            elif line.startswith("Vertices:"):
-                num_vertices = int(line.split(",")[0].split(":")[1].strip())
-                density = float(line.split(",")[1].split(":")[1].strip())
+            graph_name = line.split(":")[1].strip()
+            G = nx.Graph()
+            reading_nodes = reading_edges = False
+        
+        elif line.startswith("Vertices:"):
+            num_vertices = int(line.split(",")[0].split(":")[1].strip())
+            density = float(line.split(",")[1].split(":")[1].strip())
+
+        elif line == "Nodes:":
+            reading_nodes = True
+            reading_edges = False
+            continue
 
-            elif line == "Nodes:":
-                reading_nodes = True
-                reading_edges = False
-                continue
+        elif line == "Edges:":
+            reading_edges = True
+            reading_nodes = False
+            continue
 
-            elif line == "Edges:":
-                reading_edges = True
-                reading_nodes = False
-                continue
+        elif line.startswith("=") or not line:
+            if G is not None:
+                yield G, graph_name, num_vertices, density
+                G = None
+            reading_nodes = reading_edges = False
 
-            elif line.startswith("=") or not line:
-                if G is not None:
-                    yield G, graph_name, num_vertices, density
-                    G = None
-                reading_nodes = reading_edges = False
+        elif reading_nodes and len(line.split()) == 3:
+            node, x, y = line.split()
+            G.add_node(int(node), pos=(float(x), float(y)))
 
-            elif reading_nodes and len(line.split()) == 3:
-                node, x, y = line.split()
-                G.add_node(int(node), pos=(float(x), float(y)))
+        elif reading_edges and len(line.split()) == 2:
+            u, v = map(int, line.split())
+            G.add_edge(u, v)
 
-            elif reading_edges and len(line.split()) == 2:
-                u, v = map(int, line.split())
-                G.add_edge(u, v)
+    if G is not None:
+        yield G, graph_name, num_vertices, density
 
-        if G is not None:
-            yield G, graph_name, num_vertices, density
+def format_result(graph_name, edge_dominating_set, operation_count, duration, timed_out=False):
+    """Format a single result as it is stored in the results file."""
+    text = f"Graph: {graph_name}\n"
+    if timed_out:
+        text += "Result: Timed out after 2 minutes.\n"
+    else:
+        text += f"Edge Dominating Set: {sorted(edge_dominating_set)}\n"
+        text += f"Basic Operations: {operation_count}\n"
+        text += f"Time Taken: {duration:.4f} seconds\n"
+    return text + "=" * 40 + "\n"
 
 def write_result_to_file(result_file, graph_name, edge_dominating_set, operation_count, duration, timed_out=False):
     """Write a single result to the results file in append mode, noting if a timeout occurred."""
+    write_results_to_file(result_file, [(graph_name, edge_dominating_set, operation_count, duration, timed_out)])
+
+def write_results_to_file(result_file, results):
+    """Append a batch of (graph_name, edge_dominating_set, operation_count, duration, timed_out) results at once."""
+    texts = []
+    for result in results:
+        try:
+            texts.append(format_result(*result))
+        except Exception as e:
+            print(f"Error while writing result for {result[0]}: {e}")
+    if not texts:
+        return
     try:
         with open(result_file, "a") as f:
-            f.write(f"Graph: {graph_name}\n")
-            if timed_out:
-                f.write("Result: Timed out after 2 minutes.\n")
-            else:
-                f.write(f"Edge Dominating Set: {sorted(edge_dominating_set)}\n")
-                f.write(f"Basic Operations: {operation_count}\n")
-                f.write(f"Time Taken: {duration:.4f} seconds\n")
-            f.write("=" * 40 + "\n")
-        print(f"Result for {graph_name} saved to {result_file}")
+            f.write("".join(texts))
+        print(f"{len(texts)} results saved to {result_file}")
     except Exception as e:
         print(f"Error while writing to file: {e}")
 
-def visualize_and_save_edge_dominating_set(G, edge_dominating_set, graph_name, img_dir, title, color="blue"):
-    """Visualize and save the graph with highlighted edge dominating set."""
+def run_pipeline(graph_file, solve, write, prefetch=8, batch_size=16):
+    """Run parse -> solve -> write as a pipeline over the graphs in graph_file.
+
+    A reader thread parses graphs ahead of the solver and a writer thread hands
+    solved graphs to write in batches. Both queues are bounded by prefetch, so a
+    slow stage blocks the previous one instead of letting memory grow.
+    solve(G, graph_name, num_vertices, density) returns a result, and write gets
+    lists of (G, graph_name, num_vertices, density, result) tuples.
+    """
+    parsed = queue.Queue(maxsize=prefetch)
+    solved = queue.Queue(maxsize=prefetch)
+    errors = []
+
+    def reader():
+        try:
+            for item in parse_graph_from_text(graph_file):
+                parsed.put(item)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            parsed.put(_PIPELINE_DONE)
+
+    def writer():
+        batch = []
+        while True:
+            item = solved.get()
+            if item is not _PIPELINE_DONE:
+                batch.append(item)
+            if batch and (item is _PIPELINE_DONE or len(batch) >= batch_size or solved.empty()):
+                try:
+                    write(batch)
+                except Exception as e:
+                    errors.append(e)
+                batch = []
+            if item is _PIPELINE_DONE:
+                return
+
+    threads = [threading.Thread(target=reader, daemon=True), threading.Thread(target=writer, daemon=True)]
+    for thread in threads:
+        thread.start()
+
+    try:
+        while True:
+            item = parsed.get()
+            if item is _PIPELINE_DONE:
+                break
+            G, graph_name, num_vertices, density = item
+            solved.put((G, graph_name, num_vertices, density, solve(G, graph_name, num_vertices, density)))
+    finally:
+        solved.put(_PIPELINE_DONE)
+        threads[1].join()
+
+    if errors:
+        raise errors[0]
+
+def draw_edges_fast(ax, pos, edges, color="gray", width=1.0, alpha=1.0, max_edges=None, rasterized=False):
+    """Draw edges as a single LineCollection, keeping a random sample of max_edges of them if given."""
+    edges = list(edges)
+    if max_edges is not None and len(edges) > max_edges:
+        keep = np.random.default_rng(0).choice(len(edges), max_edges, replace=False)
+        edges = [edges[i] for i in keep]
+    segments = np.array([(pos[u], pos[v]) for u, v in edges], dtype=float).reshape(-1, 2, 2)
+    ax.add_collection(LineCollection(segments, colors=color, linewidths=width, alpha=alpha, rasterized=rasterized))
+    ax.autoscale_view()
+
+def draw_nodes_fast(ax, G, pos, color="skyblue", size=FAST_NODE_SIZE, font_size=8):
+    """Draw all nodes with one scatter call, labelling them only on graphs small enough to read."""
+    nodes = list(G.nodes())
+    coordinates = np.array([pos[node] for node in nodes], dtype=float).reshape(-1, 2)
+    ax.scatter(coordinates[:, 0], coordinates[:, 1], s=size, c=color, zorder=2)
+    if len(nodes) <= MAX_LABELLED_NODES:
+        for node, (x, y) in zip(nodes, coordinates):
+            ax.text(x, y, str(node), fontsize=font_size, ha="center", va="center", zorder=3)
+
+def is_large_graph(G):
+    """Large graphs are too slow to draw with networkx and too dense to label."""
+    return G.number_of_edges() > LARGE_GRAPH_EDGES or G.number_of_nodes() > MAX_LABELLED_NODES
+
+def visualize_and_save_edge_dominating_set(G, edge_dominating_set, graph_name, img_dir, title, color="blue", fast=None, max_edges=None, rasterized=False):
+    """Visualize and save the graph with highlighted edge dominating set.
+
+    Large graphs (or fast=True) are drawn with the fast renderer, which can also
+    subsample the background edges to max_edges and rasterize them.
+    The figure is built without pyplot, so this is safe to call from the
+    pipeline's writer thread whatever backend is configured.
+    """
     pos = nx.get_node_attributes(G, 'pos')  # Position dictionary for nodes
-    plt.figure(figsize=(8, 6))
-    
-    # Draw all edges in gray
-    nx.draw_networkx_edges(G, pos, edgelist=G.edges(), edge_color="gray", alpha=0.5)
-    # Draw edges in the edge dominating set with specified color
-    nx.draw_networkx_edges(G, pos, edgelist=edge_dominating_set, edge_color=color, width=2.5)
-    # Draw nodes
-    nx.draw_networkx_nodes(G, pos, node_color="lightgreen", node_size=500)
-    nx.draw_networkx_labels(G, pos, font_size=10, font_color="black")
+    fig = Figure(figsize=(8, 6))
+    ax = fig.add_subplot()
+
+    if fast or (fast is None and is_large_graph(G)):
+        draw_edges_fast(ax, pos, G.edges(), color="gray", alpha=0.5, max_edges=max_edges, rasterized=rasterized)
+        draw_edges_fast(ax, pos, edge_dominating_set, color=color, width=2.5)
+        draw_nodes_fast(ax, G, pos, color="lightgreen")
+        ax.set_axis_off()
+    else:
+        # Draw all edges in gray
+        nx.draw_networkx_edges(G, pos, edgelist=G.edges(), edge_color="gray", alpha=0.5, ax=ax)
+        # Draw edges in the edge dominating set with specified color
+        nx.draw_networkx_edges(G, pos, edgelist=edge_dominating_set, edge_color=color, width=2.5, ax=ax)
+        # Draw nodes
+        nx.draw_networkx_nodes(G, pos, node_color="lightgreen", node_size=500, ax=ax)
+        nx.draw_networkx_labels(G, pos, font_size=10, font_color="black", ax=ax)
     
     # Save the image
     filename = os.path.join(img_dir, f"{graph_name}_edge_dominating_set.png")
-    plt.title(title)
-    plt.savefig(filename)
-    plt.close()
+    ax.set_title(title)
+    fig.savefig(filename)
     print(f"Image saved: {filename}")
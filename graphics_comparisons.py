@@ -1,9 +1,11 @@
 import matplotlib.pyplot as plt
 from pandas_transformations import results_df
 import numpy as np
-    
-def plot_execution_time_comparison(df):
-    plt.figure(figsize=(14, 7))
+
+# Above this many graphs the per-bar labels are unreadable and dominate render time
+MAX_LABELLED_GRAPHS = 60
+
+def plot_execution_time_comparison(df, show=True):
     algorithms = df["Algorithm"].unique()
     graphs = df["Graph"].unique()
     x = np.arange(len(graphs))
@@ -31,10 +33,11 @@ def plot_execution_time_comparison(df):
 
     plt.tight_layout()
     plt.savefig("Plots/execution_time_comparison_log_scale.png")
-    plt.show()
+    if show:
+        plt.show()
+    plt.close()
 
-def plot_basic_operations_comparison(df):
-    plt.figure(figsize=(14, 7))
+def plot_basic_operations_comparison(df, show=True):
     algorithms = df["Algorithm"].unique()
     graphs = df["Graph"].unique()
     x = np.arange(len(graphs))
@@ -60,28 +63,23 @@ def plot_basic_operations_comparison(df):
     ax.set_yscale('log')  # Set y-axis to logarithmic scale
     ax.legend()
 
-    # Optionally, add data labels
-    for algorithm in algorithms:
-        for bar in bars[algorithm]:
-            yval = bar.get_height()
-            if yval > 0:
-                ax.text(
-                    bar.get_x() + bar.get_width() / 2,
-                    yval,
-                    f'{int(yval)}',
-                    ha='center',
-                    va='bottom',
-                    fontsize=8,
-                    rotation=90 if yval > 3 else 0,
-                    color='red' if yval > 60 else 'black'
-                )
+    # Optionally, add data labels (skipped when there are too many bars to read them)
+    if len(graphs) <= MAX_LABELLED_GRAPHS:
+        for algorithm in algorithms:
+            heights = bars[algorithm].datavalues
+            labels = ax.bar_label(bars[algorithm], labels=[f'{int(y)}' for y in heights], fontsize=8)
+            for label, yval in zip(labels, heights):
+                label.set_rotation(90 if yval > 3 else 0)
+                label.set_color('red' if yval > 60 else 'black')
 
     plt.tight_layout()
     plt.savefig("Plots/basic_operations_comparison_log_scale.png")
-    plt.show()
+    if show:
+        plt.show()
+    plt.close()
 
 
-def plot_solution_quality_comparison(df):
+def plot_solution_quality_comparison(df, show=True):
     plt.figure(figsize=(12, 6))
     for algorithm in df["Algorithm"].unique():
         subset = df[df["Algorithm"] == algorithm]
@@ -93,9 +91,11 @@ def plot_solution_quality_comparison(df):
     plt.legend()
     plt.tight_layout()
     plt.savefig("Plots/solution_quality_comparison.png")
-    plt.show()
+    if show:
+        plt.show()
+    plt.close()
 
-def plot_time_vs_density_comparison(df):
+def plot_time_vs_density_comparison(df, show=True):
     plt.figure(figsize=(10, 6))
     algorithms = df["Algorithm"].unique()
 
@@ -112,10 +112,12 @@ def plot_time_vs_density_comparison(df):
     plt.grid()
     plt.tight_layout()
     plt.savefig("Plots/time_vs_density_comparison_log_scale.png")
-    plt.show()
+    if show:
+        plt.show()
+    plt.close()
 
 
-def plot_time_vs_vertices_comparison(df):
+def plot_time_vs_vertices_comparison(df, show=True):
     plt.figure(figsize=(10, 6))
     algorithms = df["Algorithm"].unique()
 
@@ -132,10 +134,16 @@ def plot_time_vs_vertices_comparison(df):
     plt.grid()
     plt.tight_layout()
     plt.savefig("Plots/time_vs_vertices_comparison_log_scale.png")
-    plt.show()
-
-plot_execution_time_comparison(results_df)
-plot_basic_operations_comparison(results_df)
-plot_solution_quality_comparison(results_df)
-plot_time_vs_density_comparison(results_df)
-plot_time_vs_vertices_comparison(results_df)
+    if show:
+        plt.show()
+    plt.close()
+
+def main():
+    plot_execution_time_comparison(results_df)
+    plot_basic_operations_comparison(results_df)
+    plot_solution_quality_comparison(results_df)
+    plot_time_vs_density_comparison(results_df)
+    plot_time_vs_vertices_comparison(results_df)
+
+if __name__ == "__main__":
+    main()
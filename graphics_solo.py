@@ -11,7 +11,7 @@ PLOT_DIR = "Plots"
 os.makedirs(PLOT_DIR, exist_ok=True)  # Ensure the directory exists
 
 # 1. Comparison of Execution Time for each graph
-def plot_execution_time_log_scale(df, search):
+def plot_execution_time_log_scale(df, search, show=True):
     plt.figure(figsize=(12, 6))
     plt.bar(df["Graph"], df["Time_Taken"], color="skyblue")
     plt.xlabel("Graph")
@@ -21,7 +21,9 @@ def plot_execution_time_log_scale(df, search):
     plt.xticks(rotation=90)
     plt.tight_layout()
     plt.savefig(os.path.join(PLOT_DIR, f"execution_time_{search}_log.png"))
-    plt.show()
+    if show:
+        plt.show()
+    plt.close()
 
 
 # # 2. Basic Operations Count
@@ -35,7 +37,7 @@ def plot_execution_time_log_scale(df, search):
 #     plt.tight_layout()
 #     plt.savefig(os.path.join(PLOT_DIR, f"basic_operations{search}.png"))  # Save as PNG
 
-def plot_basic_operations_bar_chart_log(df , search):
+def plot_basic_operations_bar_chart_log(df, search, show=True):
     # Set up the style
     plt.figure(figsize=(14, 6))
     
@@ -52,7 +54,9 @@ def plot_basic_operations_bar_chart_log(df , search):
     # Save the plot to file
     plt.tight_layout()
     plt.savefig(os.path.join(PLOT_DIR, f"basic_operations{search}.png"))
-    plt.show()
+    if show:
+        plt.show()
+    plt.close()
 
 
 # 3. Solution Quality Comparison
@@ -65,6 +69,7 @@ def plot_solution_quality(df, search):
     plt.xticks(rotation=90)
     plt.tight_layout()
     plt.savefig(os.path.join(PLOT_DIR, f"solution_quality{search}.png"))   # Save as PNG
+    plt.close()
 
 # 4. Execution Time vs. Graph Density
 def plot_time_vs_density(df, search):
@@ -75,6 +80,7 @@ def plot_time_vs_density(df, search):
     plt.title("Execution Time vs. Graph Density")
     plt.grid()
     plt.savefig(os.path.join(PLOT_DIR, f"time_vs_density{search}.png"))   # Save as PNG
+    plt.close()
 
 # 5. Execution Time vs. Number of Vertices
 def plot_time_vs_vertices(df, search):
@@ -85,8 +91,9 @@ def plot_time_vs_vertices(df, search):
     plt.title("Execution Time vs. Number of Vertices")
     plt.grid()
     plt.savefig(os.path.join(PLOT_DIR, f"time_vs_vertices{search}.png"))  # Save as PNG
+    plt.close()
 
-def plot_basic_operations_vs_vertices(df,search):
+def plot_basic_operations_vs_vertices(df, search, show=True):
     # Set up the style and colors
     sns.set_style("whitegrid")
     markers = ['+', 'o', 'x', 'v']  # Markers for different densities
@@ -123,9 +130,11 @@ def plot_basic_operations_vs_vertices(df,search):
     
     plt.tight_layout()
     plt.savefig(f"Plots/basic_operations_vs_vertices_trend{search}.png")
-    plt.show()
+    if show:
+        plt.show()
+    plt.close()
 
-def plot_basic_operations_vs_vertices_fixed(df, search):
+def plot_basic_operations_vs_vertices_fixed(df, search, show=True):
     # Set up the style and colors
     sns.set_style("whitegrid")
     markers = ['+', 'o', 'x', 'v']  # Markers for different densities
@@ -168,7 +177,9 @@ def plot_basic_operations_vs_vertices_fixed(df, search):
     
     plt.tight_layout()
     plt.savefig(f"Plots/basic_operations_vs_vertices_trend{search}.png")
-    plt.show()
+    if show:
+        plt.show()
+    plt.close()
 
 
 def generate_graphics_single(df, search):
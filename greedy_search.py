@@ -1,7 +1,7 @@
 import networkx as nx
 import os
 import time
-from graph_utils import parse_graph_from_text, write_result_to_file, visualize_and_save_edge_dominating_set
+from graph_utils import run_pipeline, write_results_to_file, visualize_and_save_edge_dominating_set
 
 # Define paths for storing results and images
 GRAPH_TEXT_FILE = "Graphs/all_graphs_data.txt"
@@ -19,8 +19,11 @@ def get_sorted_adjacent_edges(G, node):
     """Return a set of sorted edges adjacent to a node."""
     return set(sorted_edge(node, neighbor) for neighbor in G.neighbors(node))
 
-def greedy_edge_dominating_set(G):
-    """Find an edge dominating set using a greedy algorithm with consistent edge representation."""
+def greedy_edge_dominating_set(G, deadline=None):
+    """Find an edge dominating set using a greedy algorithm with consistent edge representation.
+
+    If deadline (a time.time() value) passes, TimeoutError is raised between picks.
+    """
     covered_edges = set()
     dominating_set = set()
     operation_count = 0
@@ -31,6 +34,8 @@ def greedy_edge_dominating_set(G):
     all_edges = set(sorted_edge(u, v) for u, v in G.edges())
     
     while len(covered_edges) < len(all_edges):
+        if deadline is not None and time.time() > deadline:
+            raise TimeoutError(f"Greedy search stopped after {operation_count} operations")
         best_edge = None
         max_coverage = 0
         
@@ -60,24 +65,34 @@ def greedy_edge_dominating_set(G):
     return dominating_set, operation_count, duration
 
 
+def write_greedy_results(batch):
+    """Save the results and images of a batch of solved graphs; a failed image does not lose any results."""
+    write_results_to_file(RESULT_TEXT_FILE, [
+        (graph_name, edge_dominating_set, operation_count, duration, False)
+        for _, graph_name, _, _, (edge_dominating_set, operation_count, duration) in batch
+    ])
+
+    for G, graph_name, num_vertices, density, (edge_dominating_set, operation_count, duration) in batch:
+        # Visualize and save the graph image with the edge dominating set
+        try:
+            visualize_and_save_edge_dominating_set(
+                G, edge_dominating_set, graph_name, GREEDY_EDGE_DOMINATING_IMG_DIR,
+                title=f"Greedy Edge Dominating Set for {graph_name}", color="blue"
+            )
+        except Exception as e:
+            print(f"Error while saving image for {graph_name}: {e}")
+
+def solve_greedy(G, graph_name, num_vertices, density):
+    print(f"Processing {graph_name} with {num_vertices} vertices and density {density}")
+    return greedy_edge_dominating_set(G)
+
 def main():
     # Clear the results file at the start
     with open(RESULT_TEXT_FILE, "w") as f:
         f.write("")  # Empty the file
 
-    for G, graph_name, num_vertices, density in parse_graph_from_text(GRAPH_TEXT_FILE):
-        print(f"Processing {graph_name} with {num_vertices} vertices and density {density}")
-        
-        edge_dominating_set, operation_count, duration = greedy_edge_dominating_set(G)
-        
-        # Visualize and save the graph image with the edge dominating set
-        visualize_and_save_edge_dominating_set(
-            G, edge_dominating_set, graph_name, GREEDY_EDGE_DOMINATING_IMG_DIR,
-            title=f"Greedy Edge Dominating Set for {graph_name}", color="blue"
-        )
-        
-        # Write the result immediately after finding it
-        write_result_to_file(RESULT_TEXT_FILE, graph_name, edge_dominating_set, operation_count, duration)
+    # Parse ahead, solve and write results as they arrive
+    run_pipeline(GRAPH_TEXT_FILE, solve_greedy, write_greedy_results)
 
 if __name__ == "__main__":
     main()
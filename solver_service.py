@@ -0,0 +1,157 @@
+import argparse
+import json
+import multiprocessing
+import queue
+import socketserver
+import sys
+import threading
+import time
+import networkx as nx
+from exaustive_search import minimum_edge_dominating_set_batched, TIMEOUT
+from graph_utils import parse_graph_from_lines
+from greedy_search import greedy_edge_dominating_set
+
+# Solvers the service can run, each taking (G, deadline) and returning (edge_dominating_set, operation_count)
+ALGORITHMS = {
+    "greedy": lambda G, deadline: greedy_edge_dominating_set(G, deadline=deadline)[:2],
+    "exhaustive": lambda G, deadline: minimum_edge_dominating_set_batched(G, deadline=deadline),
+}
+
+DEFAULT_PORT = 8765
+# Jobs of one client submitted to the pool but not finished yet; reading its input pauses at this limit
+MAX_IN_FLIGHT = 64
+
+def graph_from_job(job):
+    """Build the graph of a job, sent either in the text file format ("graph") or as JSON lists ("nodes", "edges")."""
+    if "graph" in job:
+        parsed = next(parse_graph_from_lines(job["graph"].splitlines()), None)
+        if parsed is None:
+            raise ValueError("no graph found in 'graph' text")
+        return parsed[0]
+    G = nx.Graph()
+    for node in job.get("nodes", []):
+        if isinstance(node, list):
+            G.add_node(node[0], pos=tuple(node[1:3]))
+        else:
+            G.add_node(node)
+    G.add_edges_from(job["edges"])
+    return G
+
+def solve_job(line):
+    """Solve one JSON job line in a worker and return the JSON response line.
+
+    A job looks like {"id": 1, "algorithm": "greedy", "deadline": 5, "edges": [[0, 1], [1, 2]]};
+    deadline is the number of seconds the solver may run, counted from when a worker picks the job up.
+    """
+    start_time = time.time()
+    job_id = None
+    try:
+        job = json.loads(line)
+        job_id = job.get("id")
+        algorithm = job.get("algorithm", "greedy")
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"unknown algorithm {algorithm!r}, expected one of {sorted(ALGORITHMS)}")
+        solver = ALGORITHMS[algorithm]
+        G = graph_from_job(job)
+        deadline = start_time + job.get("deadline", TIMEOUT)
+        try:
+            edge_dominating_set, operation_count = solver(G, deadline)
+            timed_out = False
+        except TimeoutError:
+            edge_dominating_set, operation_count, timed_out = None, None, True
+        response = {
+            "id": job_id,
+            "edge_dominating_set": sorted(edge_dominating_set) if edge_dominating_set else [],
+            "basic_operations": operation_count,
+            "time_taken": time.time() - start_time,
+            "timed_out": timed_out,
+        }
+    except Exception as e:
+        response = {"id": job_id, "error": f"{type(e).__name__}: {e}"}
+    return json.dumps(response)
+
+def jobs(lines):
+    """Skip blank lines so they do not turn into error responses."""
+    return (line for line in lines if line.strip())
+
+def dispatch(pool, lines, write, max_in_flight=MAX_IN_FLIGHT):
+    """Submit each job to the pool as soon as its line is read and write every response as it finishes.
+
+    At most max_in_flight jobs are queued or running at once, so a client streaming
+    many jobs cannot fill memory. Responses are written by a dedicated thread, so a
+    slow reader never stalls the pool's result handling for other clients. Returns
+    once every response is written.
+    """
+    responses = queue.Queue()
+    in_flight = threading.BoundedSemaphore(max_in_flight)
+
+    def finish(response):
+        responses.put(response)
+        in_flight.release()
+
+    def fail(e):
+        finish(json.dumps({"id": None, "error": f"{type(e).__name__}: {e}"}))
+
+    def writer():
+        while True:
+            response = responses.get()
+            if response is None:
+                return
+            write(response + "\n")
+
+    writer_thread = threading.Thread(target=writer, daemon=True)
+    writer_thread.start()
+
+    try:
+        for line in jobs(lines):
+            in_flight.acquire()
+            pool.apply_async(solve_job, (line,), callback=finish, error_callback=fail)
+    finally:
+        # Every job has finished, and queued its response, once all slots are free again
+        for _ in range(max_in_flight):
+            in_flight.acquire()
+        responses.put(None)
+        writer_thread.join()
+
+def serve_stdio(pool):
+    """Read jobs from stdin and write responses to stdout as they finish (match them by "id")."""
+    def write(response):
+        sys.stdout.write(response)
+        sys.stdout.flush()
+
+    dispatch(pool, sys.stdin, write)
+
+def serve_socket(pool, port):
+    """Accept JSON line jobs over local TCP connections, sharing the worker pool between them."""
+    class JobHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            def write(response):
+                self.wfile.write(response.encode())
+                self.wfile.flush()
+
+            dispatch(pool, (line.decode() for line in self.rfile), write)
+
+    class JobServer(socketserver.ThreadingTCPServer):
+        allow_reuse_address = True
+        daemon_threads = True
+
+    with JobServer(("127.0.0.1", port), JobHandler) as server:
+        print(f"Solver service listening on 127.0.0.1:{port}", file=sys.stderr)
+        server.serve_forever()
+
+def main():
+    parser = argparse.ArgumentParser(description="Solve edge dominating set jobs with a pool of warm workers.")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes (default: CPU count)")
+    parser.add_argument("--port", type=int, nargs="?", const=DEFAULT_PORT, default=None,
+                        help=f"serve over a local socket instead of stdin/stdout (default port {DEFAULT_PORT})")
+    args = parser.parse_args()
+
+    # Workers are started once and reused for every job
+    with multiprocessing.Pool(args.workers) as pool:
+        if args.port is None:
+            serve_stdio(pool)
+        else:
+            serve_socket(pool, args.port)
+
+if __name__ == "__main__":
+    main()
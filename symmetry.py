@@ -0,0 +1,176 @@
+import time
+import numpy as np
+
+def sorted_edge(u, v):
+    """Return a tuple with the smaller node first."""
+    return (u, v) if u <= v else (v, u)
+
+def check_deadline(deadline):
+    if deadline is not None and time.time() > deadline:
+        raise TimeoutError("Automorphism search ran past the deadline")
+
+def refine_colours(neighbours, colours, deadline=None):
+    """Colour refinement: split colour classes by the multiset of neighbour colours until the partition is stable.
+
+    New colours are ranks of the (colour, neighbour colours) signatures, so they do not depend on vertex names.
+    """
+    num_colours = len(set(colours))
+    while True:
+        check_deadline(deadline)
+        signatures = [(colours[v], tuple(sorted(colours[w] for w in neighbours[v]))) for v in range(len(colours))]
+        ranks = {signature: i for i, signature in enumerate(sorted(set(signatures)))}
+        colours = [ranks[signature] for signature in signatures]
+        if len(ranks) == num_colours:
+            return colours
+        num_colours = len(ranks)
+
+def orbit(v, generators):
+    """Return the orbit of v under the group generated by generators (dicts)."""
+    found, frontier = {v}, [v]
+    while frontier:
+        w = frontier.pop()
+        for generator in generators:
+            if generator[w] not in found:
+                found.add(generator[w])
+                frontier.append(generator[w])
+    return found
+
+def automorphisms(G, deadline=None):
+    """Return automorphisms of G (identity excluded) as dicts that generate its whole automorphism group.
+
+    Two copies of G are refined together: vertex v of the first copy can map to w
+    of the second only if, after individualising both, every colour class is
+    split evenly between the copies. Discrete balanced colourings give the maps.
+    Walking down the path that individualises the same vertex v in both copies,
+    one automorphism is kept for each image of v not yet reached by the ones
+    found below it, so at most n - 1 are returned (as nauty does).
+    Raises TimeoutError if deadline (a time.time() value) passes.
+    """
+    nodes = sorted(G)
+    n = len(nodes)
+    index = {node: i for i, node in enumerate(nodes)}
+    single = [[index[w] for w in G.neighbors(node)] for node in nodes]
+    # The first copy uses indices 0..n-1, the second n..2n-1
+    neighbours = single + [[w + n for w in adjacent] for adjacent in single]
+    edges = set(sorted_edge(index[u], index[v]) for u, v in G.edges())
+
+    def refine(colours):
+        """Refine colours and return them with the first non-singleton cell, or None if the copies do not match."""
+        colours = refine_colours(neighbours, colours, deadline)
+        classes = {}
+        for v, colour in enumerate(colours):
+            classes.setdefault(colour, ([], []))[v >= n].append(v if v < n else v - n)
+        if any(len(first) != len(second) for first, second in classes.values()):
+            return colours, None
+        cells = [classes[colour] for colour in sorted(classes) if len(classes[colour][0]) > 1]
+        if not cells:
+            return colours, {first[0]: second[0] for first, second in classes.values()}
+        return colours, cells[0]
+
+    def individualise(colours, v, w):
+        individualised = list(colours)
+        individualised[v] = individualised[w + n] = max(colours) + 1
+        return individualised
+
+    def find(colours):
+        """Return any automorphism consistent with colours, or None."""
+        colours, cell = refine(colours)
+        if isinstance(cell, dict):
+            return cell if all(sorted_edge(cell[u], cell[v]) in edges for u, v in edges) else None
+        if cell is None:
+            return None
+        first, second = cell
+        for w in second:
+            mapping = find(individualise(colours, first[0], w))
+            if mapping is not None:
+                return mapping
+        return None
+
+    # Individualise the first vertex of the first non-singleton cell identically in both copies
+    path = []
+    colours, cell = refine([0] * (2 * n))
+    while isinstance(cell, tuple):
+        v = cell[0][0]
+        path.append((colours, v, cell[1]))
+        colours, cell = refine(individualise(colours, v, v))
+
+    # Deepest first, so the automorphisms fixing more of the path are known when looking for images of v
+    found = []
+    for colours, v, candidates in reversed(path):
+        reached = orbit(v, found)
+        for w in candidates:
+            if w in reached:
+                continue
+            mapping = find(individualise(colours, v, w))
+            if mapping is not None:
+                found.append(mapping)
+                reached = orbit(v, found)
+    return [{nodes[v]: nodes[w] for v, w in mapping.items()} for mapping in found]
+
+def edge_permutations(G, edges, deadline=None):
+    """Return the distinct non-trivial permutations of the edge indices induced by automorphisms of G and their inverses.
+
+    Together they generate the permutation group the automorphisms of G induce on the edges.
+    """
+    index = {edge: i for i, edge in enumerate(edges)}
+    identity = np.arange(len(edges))
+    permutations = {}
+    for mapping in automorphisms(G, deadline):
+        permutation = np.array([index[sorted_edge(mapping[u], mapping[v])] for u, v in edges], dtype=np.intp)
+        if not np.array_equal(permutation, identity):
+            for image in (permutation, np.argsort(permutation)):
+                permutations[image.tobytes()] = image
+    return list(permutations.values())
+
+def extension_blocks(num_edges, prefixes, permutations, block_size):
+    """Yield (block, rejected): the extensions of prefixes by a larger element that pass the orbit test, in order.
+
+    A subset is canonical when it is lexicographically least among its images. If
+    S + {e} is canonical, every automorphism g that maps S onto itself has g(e) >= e,
+    since S + {g(e)} would otherwise be smaller. So each prefix is only extended by
+    the edges that no permutation stabilising it maps to a smaller edge. rejected[i]
+    counts the extensions skipped before row i of the block, and rejected[-1] all of them.
+    """
+    permutations = np.array(permutations, dtype=np.intp).reshape(-1, num_edges)
+    lowers = permutations < np.arange(num_edges)
+    chunk = max(1, block_size // max(num_edges, 1))
+    for start in range(0, len(prefixes), chunk):
+        block_prefixes = prefixes[start:start + chunk]
+        lasts = block_prefixes[:, -1] if block_prefixes.shape[1] else np.full(len(block_prefixes), -1)
+        larger = np.arange(num_edges) > lasts[:, None]
+        # stabilises[p, i]: permutation p maps prefix i onto itself
+        stabilises = (np.sort(permutations[:, block_prefixes], axis=2) == block_prefixes).all(axis=2)
+        lowered = (stabilises.T.astype(np.int32) @ lowers.astype(np.int32)) > 0
+        kept = larger & ~lowered
+        rows, extensions = np.nonzero(kept)
+        block = np.hstack([block_prefixes[rows], extensions[:, None]]).astype(np.intp)
+        # Rows are in lexicographic order, so the skipped extensions before a row are a prefix count
+        skipped = np.cumsum((larger & lowered).ravel())
+        yield block, np.append(skipped[np.flatnonzero(kept.ravel())], skipped[-1])
+
+def pruned_subset_blocks(num_edges, size, permutations, block_size):
+    """Yield (block, rejected) for the subsets of size edge indices that survive the orbit test, in lexicographic order.
+
+    rejected counts the subsets skipped before each row and in the whole block, as in extension_blocks.
+
+    Canonical subsets stay canonical when their largest element is removed, so
+    extending only the surviving prefixes keeps every canonical subset. The
+    prefixes one element shorter are regenerated lazily, block by block, instead
+    of being kept, so memory stays at about one block per size.
+    """
+    if size == 0:
+        yield np.empty((1, 0), dtype=np.intp), np.zeros(2, dtype=np.intp)
+        return
+    pending, pending_rejected, pending_rows, total_rejected = [], [], 0, 0
+    for prefixes, _ in pruned_subset_blocks(num_edges, size - 1, permutations, block_size):
+        for block, rejected in extension_blocks(num_edges, prefixes, permutations, block_size):
+            # Pruning leaves small blocks; regroup them so each vectorized step stays large
+            pending.append(block)
+            pending_rejected.append(rejected[:-1] + total_rejected)
+            pending_rows += len(block)
+            total_rejected += int(rejected[-1])
+            if pending_rows >= block_size:
+                yield np.vstack(pending), np.append(np.concatenate(pending_rejected), total_rejected)
+                pending, pending_rejected, pending_rows, total_rejected = [], [], 0, 0
+    if pending:
+        yield np.vstack(pending), np.append(np.concatenate(pending_rejected), total_rejected)
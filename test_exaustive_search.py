@@ -0,0 +1,92 @@
+import importlib
+import os
+import random
+from itertools import combinations
+import networkx as nx
+import pytest
+
+
+def import_away_from_repository(tmp_path_factory, name):
+    # The solver modules create their image directories on import, so import them away from the repository
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("graphs"))
+    try:
+        return importlib.import_module(name)
+    finally:
+        os.chdir(cwd)
+
+
+@pytest.fixture(scope="module")
+def exaustive_search(tmp_path_factory):
+    return import_away_from_repository(tmp_path_factory, "exaustive_search")
+
+
+@pytest.fixture(scope="module")
+def optimality_gap(tmp_path_factory):
+    return import_away_from_repository(tmp_path_factory, "optimality_gap")
+
+
+def sorted_edge(u, v):
+    return (u, v) if u <= v else (v, u)
+
+
+def is_edge_dominating_set(edge_subset, all_edges):
+    """Reference check: every edge outside the subset shares a vertex with an edge in it."""
+    return all(any(u in e or v in e for e in edge_subset) for u, v in set(all_edges) - set(edge_subset))
+
+
+def sequential_search(G):
+    """Test one subset at a time, in the same (sorted) order as the batched engine."""
+    all_edges = sorted(sorted_edge(u, v) for u, v in G.edges())
+    operation_count = 0
+    for size in range(1, len(all_edges) + 1):
+        for edge_subset in combinations(all_edges, size):
+            operation_count += 1
+            if is_edge_dominating_set(edge_subset, all_edges):
+                return set(edge_subset), operation_count
+    return None, operation_count
+
+
+def random_graphs(count=300, max_vertices=8):
+    rng = random.Random(124467)
+    for seed in range(count):
+        yield nx.gnp_random_graph(rng.randint(1, max_vertices), rng.random(), seed=seed)
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 4096])
+def test_batched_search_matches_sequential_search(exaustive_search, block_size):
+    for G in random_graphs():
+        expected = sequential_search(G)
+        assert exaustive_search.minimum_edge_dominating_set_batched(G, block_size=block_size, symmetry=False) == expected
+
+
+def symmetric_graphs():
+    yield nx.complete_graph(6)
+    yield nx.cycle_graph(9)
+    yield nx.complete_bipartite_graph(3, 4)
+    yield nx.petersen_graph()
+    yield nx.convert_node_labels_to_integers(nx.cartesian_product(nx.cycle_graph(4), nx.path_graph(3)))
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 4096])
+def test_symmetry_pruning_finds_the_same_set_with_fewer_configurations(exaustive_search, block_size):
+    for G in random_graphs():
+        expected_set, expected_count = sequential_search(G)
+        found_set, count = exaustive_search.minimum_edge_dominating_set_batched(G, block_size=block_size)
+        assert found_set == expected_set
+        assert count <= expected_count
+    for G in symmetric_graphs():
+        expected_set, expected_count = sequential_search(G)
+        found_set, count = exaustive_search.minimum_edge_dominating_set_batched(G, block_size=block_size)
+        assert found_set == expected_set
+        assert count < expected_count
+
+
+def test_lower_bounds_never_exceed_the_minimum(exaustive_search, optimality_gap):
+    for G in [*random_graphs(), *symmetric_graphs()]:
+        found_set, _ = exaustive_search.minimum_edge_dominating_set_batched(G)
+        minimum = len(found_set) if found_set else 0  # Graphs without edges need no edges
+        _, neighbourhoods = optimality_gap.closed_edge_neighbourhoods(G)
+        assert optimality_gap.matching_lower_bound(G) <= minimum
+        assert optimality_gap.lp_lower_bound(neighbourhoods) <= minimum
+        assert optimality_gap.packing_lower_bound(neighbourhoods) <= minimum
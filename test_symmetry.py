@@ -0,0 +1,51 @@
+import networkx as nx
+import pytest
+from symmetry import automorphisms, edge_permutations, sorted_edge
+
+
+def group_order(generators):
+    """Size of the group generated by permutations given as tuples."""
+    identity = tuple(range(len(generators[0]))) if generators else ()
+    group, frontier = {identity}, [identity]
+    while frontier:
+        element = frontier.pop()
+        for generator in generators:
+            product = tuple(generator[i] for i in element)
+            if product not in group:
+                group.add(product)
+                frontier.append(product)
+    return len(group)
+
+
+KNOWN_GROUPS = [
+    (nx.path_graph(5), 2),
+    (nx.cycle_graph(6), 12),
+    (nx.complete_graph(5), 120),
+    (nx.complete_bipartite_graph(3, 3), 72),
+    (nx.petersen_graph(), 120),
+    (nx.convert_node_labels_to_integers(nx.hypercube_graph(3)), 48),
+    (nx.star_graph(4), 24),
+    (nx.frucht_graph(), 1),
+]
+
+
+@pytest.mark.parametrize("G, order", KNOWN_GROUPS)
+def test_automorphisms_generate_the_known_group(G, order):
+    nodes = sorted(G)
+    edges = set(sorted_edge(u, v) for u, v in G.edges())
+    generators = automorphisms(G)
+    for mapping in generators:
+        assert sorted(mapping) == nodes and sorted(mapping.values()) == nodes
+        assert all(sorted_edge(mapping[u], mapping[v]) in edges for u, v in edges)
+    assert len(generators) < max(len(nodes), 2)
+    assert group_order([tuple(mapping[v] for v in nodes) for mapping in generators]) == order
+
+
+@pytest.mark.parametrize("G, order", KNOWN_GROUPS)
+def test_edge_permutations_generate_the_induced_group(G, order):
+    edges = sorted(sorted_edge(u, v) for u, v in G.edges())
+    permutations = edge_permutations(G, edges)
+    for permutation in permutations:
+        assert sorted(permutation) == list(range(len(edges)))
+    # Every group here acts faithfully on the edges
+    assert group_order([tuple(permutation) for permutation in permutations]) == order